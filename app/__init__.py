@@ -1,12 +1,15 @@
-from flask import Flask
 from config import Config
-from app.extensions import db
 
 def create_app(config_class=Config):
+    # Flask is imported here rather than at module level so that importing the models
+    # or the batch CLI (app/cli.py) does not pay for it
+    from flask import Flask
+    from app.extensions import db
+
     app = Flask(__name__)
     app.config.from_object(config_class)
     # Initialize Flask extensions here
     db.init_app(app)
     # Register blueprints here
 
-    return app
\ No newline at end of file
+    return app
@@ -0,0 +1,88 @@
+import argparse
+from config import Config
+from app.helpers import ranking
+from app.helpers.ranked_snapshot import RankedSnapshot
+
+# Heavy modules (SQLAlchemy, pandas and the models) are imported inside the subcommands
+# that need them, so each batch job only pays for what it uses. Only `ingest` needs pandas.
+
+def create_session(config_class=Config):
+    """
+    Creates a plain SQLAlchemy session for the configured database, without a Flask app.
+
+    Args:
+        config_class (class): The configuration class providing `SQLALCHEMY_DATABASE_URI`.
+
+    Returns:
+        Session: A new database session.
+    """
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    engine = create_engine(config_class.SQLALCHEMY_DATABASE_URI)
+    return Session(engine)
+
+def ingest(args):
+    """
+    Recreates the database from a CSV file of reviews.
+
+    This subcommand runs the same `ingestion.ingest` step as `run.py`: it drops and recreates
+    all tables, parses the CSV file and updates each sitter with their sum and count of reviews.
+    """
+    from app.helpers import ingestion
+
+    with create_session() as session:
+        ingestion.ingest(session, args.csv_path)
+
+def score(args):
+    """
+    Ranks sitters by search score and publishes the results.
+
+    This subcommand writes the changes since the previous snapshot to `args.delta`
+    and then atomically replaces the ranked snapshot at `args.snapshot`.
+    """
+    from app.models.sitter import Sitter
+
+    with create_session() as session:
+        ranked_records = ranking.rank(Sitter.calculate_all_search_scores(session))
+    ranking.publish(ranked_records, args.snapshot, args.delta)
+
+def export(args):
+    """
+    Exports the ranked snapshot to a CSV file.
+
+    This subcommand reads the memory-mapped snapshot at `args.snapshot` and writes it
+    to `args.output` in the same format as `run.py`, without touching the database.
+    """
+    with RankedSnapshot(args.snapshot) as snapshot:
+        ranking.write_csv(snapshot.top_k(len(snapshot)), args.output)
+
+def main(argv=None):
+    """
+    Main entry point of the batch CLI, e.g. `python -m app.cli ingest data/reviews.csv`.
+
+    Args:
+        argv (list): The command-line arguments. Defaults to `sys.argv[1:]`.
+    """
+    parser = argparse.ArgumentParser(prog='python -m app.cli', description="Batch jobs for sitter search scores.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    ingest_parser = subparsers.add_parser('ingest', help="Recreate the database from a CSV file of reviews.")
+    ingest_parser.add_argument('csv_path', help="The path to the CSV file.")
+    ingest_parser.set_defaults(handler=ingest)
+
+    score_parser = subparsers.add_parser('score', help="Rank sitters and publish the snapshot and delta.")
+    score_parser.add_argument('--snapshot', default='sitters.snapshot', help="The ranked snapshot to replace.")
+    score_parser.add_argument('--delta', default='sitters_delta.csv', help="The CSV file to write changes to.")
+    score_parser.set_defaults(handler=score)
+
+    export_parser = subparsers.add_parser('export', help="Export the ranked snapshot to a CSV file.")
+    export_parser.add_argument('--snapshot', default='sitters.snapshot', help="The ranked snapshot to read.")
+    export_parser.add_argument('--output', default='sitters.csv', help="The CSV file to write.")
+    export_parser.set_defaults(handler=export)
+
+    args = parser.parse_args(argv)
+    args.handler(args)
+
+if __name__ == '__main__':
+    main()
@@ -1,2 +1,5 @@
 from flask_sqlalchemy import SQLAlchemy
-db = SQLAlchemy()
\ No newline at end of file
+from app.models.base import Base
+# Models are declared with plain SQLAlchemy so they can be used without Flask (see app/cli.py);
+# the Flask extension shares their metadata.
+db = SQLAlchemy(metadata=Base.metadata)
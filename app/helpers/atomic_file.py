@@ -0,0 +1,32 @@
+import os
+import uuid
+
+def write_atomically(path, chunks):
+    """
+    Writes data to a file and atomically publishes it at `path`.
+
+    Args:
+        path (str): The path to publish the file at.
+        chunks (iterable): Bytes-like chunks making up the file's contents.
+
+    The data is written to a temporary file in the same directory, flushed to disk and then
+    renamed over `path`, so readers see either the previous file or the new one, never a
+    partially written file. If writing fails, the temporary file is removed and `path` is
+    left untouched.
+
+    The temporary file is created with mode 0666 and the kernel applies the process umask,
+    so the published file gets the usual permissions without changing the umask.
+    """
+    directory, name = os.path.split(os.path.abspath(path))
+    tmp_path = os.path.join(directory, f'.{name}.{uuid.uuid4().hex}.tmp')
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in chunks:
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
@@ -0,0 +1,76 @@
+import pandas as pd
+from app.helpers.csv_handler import CsvHandler
+from app.models.base import Base
+from app.models.review import Review
+from app.models.sitter import Sitter
+
+def create_db(session):
+    """
+    Drops the current db and recreates it.
+
+    Args:
+        session: The database session whose engine holds the tables.
+    """
+    Base.metadata.drop_all(session.get_bind())
+    Base.metadata.create_all(session.get_bind())
+
+def bulk_update(session, entity_df, entity_class):
+    """
+    Bulk updates entities in the database from a DataFrame.
+
+    Args:
+        session: The database session to use for the update.
+        entity_df (DataFrame): The DataFrame containing entity data to be updated.
+        entity_class (class): The ORM class representing the database table.
+
+    This function drops duplicate rows from the given DataFrame, converts it to a list of dictionaries,
+    and then performs a bulk update in the database using the `bulk_update` method of the `entity_class`.
+    """
+    unique_entity_df = entity_df.drop_duplicates()
+    unique_entity_list = unique_entity_df.to_dict(orient='records')
+    entity_class.bulk_update(session, unique_entity_list)
+
+def parse_csv(session, csv_path):
+    """
+    Parses a CSV file and commits its data to the database.
+
+    Args:
+        session: The database session to commit the data with.
+        csv_path (str): The path to the CSV file.
+
+    This function creates an instance of `CsvHandler` and calls its
+    `parse_and_commit_data` method to handle the parsing and committing process.
+    """
+    csv_handler = CsvHandler(csv_path, session)
+    csv_handler.parse_and_commit_data()
+
+def update_sitter_info(session):
+    """
+    Updates sitter information in the database with review statistics.
+
+    Args:
+        session: The database session to use for the query and update.
+
+    This function queries review statistics per sitter, renames columns for consistency,
+    and uses `bulk_update` to update each sitter with their respective sum and count of reviews.
+    The session is then committed to save the updates.
+    """
+    sitter_review_df = pd.read_sql(Review.get_reviews_per_reviewee(session).statement, con=session.get_bind())
+    sitter_review_df = sitter_review_df.rename(columns={'reviewee': 'id'})
+    bulk_update(session, sitter_review_df, Sitter)
+    session.commit()
+
+def ingest(session, csv_path):
+    """
+    Recreates the database from a CSV file of reviews.
+
+    Args:
+        session: The database session to use, either Flask-SQLAlchemy's `db.session` or a plain session.
+        csv_path (str): The path to the CSV file.
+
+    This function creates the database, parses the CSV file to populate it and updates
+    sitter information with review statistics.
+    """
+    create_db(session)
+    parse_csv(session, csv_path)
+    update_sitter_info(session)
@@ -0,0 +1,114 @@
+import logging
+import os
+from app.helpers.ranked_snapshot import RankedSnapshot
+
+logger = logging.getLogger(__name__)
+
+SCORE_COLUMNS = ['profile_score', 'ratings_score', 'search_score']
+DELTA_COLUMNS = ['change', 'email', 'name', 'rank'] + SCORE_COLUMNS
+
+def _email_key(email):
+    """
+    Returns the sort key used to merge sitters by email.
+
+    Emails are compared by their UTF-8 bytes so the new ranking merges in the same
+    order as a `RankedSnapshot` email index.
+    """
+    return (email or '').encode('utf-8')
+
+def _changed(old_record, new_record):
+    """
+    Checks whether a sitter present in both runs has a different name or scores.
+    """
+    if old_record['name'] != (new_record['name'] or ''):
+        return True
+    return any(
+        round(old_record[column], 2) != round(new_record[column], 2)
+        for column in SCORE_COLUMNS
+    )
+
+def _delta_row(change, record):
+    """
+    Builds a delta row with every delta column, leaving missing values as None.
+    """
+    row = {column: record.get(column) for column in DELTA_COLUMNS}
+    row['change'] = change
+    return row
+
+def compute_rank_delta(previous_records, ranked_records):
+    """
+    Computes the changes between a previous ranking and a new one.
+
+    Args:
+        previous_records (iterable): The previous run's sitter records in email order, such as
+            `RankedSnapshot.iter_by_email()`. Pass an empty iterable if there is no previous run.
+        ranked_records (list): The new sitter dictionaries sorted best ranked first, as returned by
+            `ranking.rank`.
+
+    Returns:
+        list: One dictionary per changed sitter with `change`, `email`, `name`, `rank` and score keys.
+        `change` is 'inserted', 'removed' or 'rescored'. Inserted and re-scored sitters carry their
+        new scores; removed sitters only carry their email, with the other keys set to None.
+
+    Both rankings are walked once in email order and merged, so apart from sorting the new
+    ranking the work done per sitter is constant. Sitters whose name and scores are unchanged
+    are left out, even if their rank shifted because other sitters moved around them.
+
+    Because of that, `rank` is not something a consumer can apply on its own: the ranks of
+    sitters left out of the delta may have changed too. It is only the sitter's position in
+    this run's full ranking, and consumers must re-sort their merged set by `search_score`
+    (descending) and `name` (ascending) to get every sitter's current rank.
+    """
+    new_records = [
+        dict(record, rank=position + 1) for position, record in enumerate(ranked_records)
+    ]
+    new_records.sort(key=lambda record: _email_key(record['email']))
+
+    delta = []
+    old_iter = iter(previous_records)
+    new_iter = iter(new_records)
+    old_record = next(old_iter, None)
+    new_record = next(new_iter, None)
+    while old_record is not None or new_record is not None:
+        if new_record is None or (
+            old_record is not None and _email_key(old_record['email']) < _email_key(new_record['email'])
+        ):
+            delta.append(_delta_row('removed', {'email': old_record['email']}))
+            old_record = next(old_iter, None)
+        elif old_record is None or _email_key(new_record['email']) < _email_key(old_record['email']):
+            delta.append(_delta_row('inserted', new_record))
+            new_record = next(new_iter, None)
+        else:
+            if _changed(old_record, new_record):
+                delta.append(_delta_row('rescored', new_record))
+            old_record = next(old_iter, None)
+            new_record = next(new_iter, None)
+
+    return delta
+
+def compute_rank_delta_since(snapshot_path, ranked_records):
+    """
+    Computes the changes between the ranking in a snapshot file and a new one.
+
+    Args:
+        snapshot_path (str): The path to the previous run's `RankedSnapshot`.
+        ranked_records (list): The new sitter dictionaries sorted best ranked first.
+
+    Returns:
+        list: The delta returned by `compute_rank_delta`.
+
+    If the snapshot does not exist, or cannot be read because it is truncated or from an
+    unsupported version, it is treated as no previous run and every sitter is inserted.
+    This lets the next published snapshot replace an unreadable one instead of failing
+    every run.
+    """
+    previous_snapshot = None
+    if os.path.exists(snapshot_path):
+        try:
+            previous_snapshot = RankedSnapshot(snapshot_path)
+        except ValueError as e:
+            logger.warning("Ignoring unreadable previous snapshot, exporting a full delta: %s", e)
+    if previous_snapshot is None:
+        return compute_rank_delta([], ranked_records)
+    with previous_snapshot:
+        return compute_rank_delta(previous_snapshot.iter_by_email(), ranked_records)
@@ -0,0 +1,245 @@
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from app.helpers.atomic_file import write_atomically
+
+class RankedSnapshot:
+    """
+    A read-only, memory-mapped view of ranked sitter search scores.
+
+    The snapshot file is laid out as a fixed header followed by fixed-width arrays and
+    a single UTF-8 string blob, so readers can `mmap` it and answer queries without
+    parsing or copying the whole file:
+
+        header          magic, format version, number of sitters
+        ids             int64[n]    sitter ids in rank order
+        profile_scores  float64[n]  profile scores in rank order
+        ratings_scores  float64[n]  ratings scores in rank order
+        search_scores   float64[n]  search scores in rank order
+        name_offsets    uint64[n+1] offsets of each name in the string blob
+        email_offsets   uint64[n+1] offsets of each email in the string blob
+        email_index     uint64[n]   rank positions sorted by email
+        id_index        uint64[n]   rank positions sorted by sitter id
+        blob            bytes       concatenated names and emails
+
+    Every array is 8 bytes wide, so every section stays 8-byte aligned.
+
+    Attributes:
+        path (str): The path of the snapshot file.
+        count (int): The number of sitters in the snapshot.
+    """
+
+    MAGIC = b'RVSNAP\x00\x01'
+    VERSION = 1
+    HEADER = struct.Struct('<8sIIQ')
+    SECTIONS = (
+        ('ids', 'q', 0),
+        ('profile_scores', 'd', 0),
+        ('ratings_scores', 'd', 0),
+        ('search_scores', 'd', 0),
+        ('name_offsets', 'Q', 1),
+        ('email_offsets', 'Q', 1),
+        ('email_index', 'Q', 0),
+        ('id_index', 'Q', 0),
+    )
+
+    def __init__(self, path):
+        """
+        Opens and memory-maps a snapshot file written by `RankedSnapshot.write`.
+
+        Args:
+            path (str): The path to the snapshot file.
+
+        Raises:
+            ValueError: If the file is not a snapshot of a supported version, or is truncated.
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+
+        if len(self._mmap) < self.HEADER.size:
+            self.close()
+            raise ValueError(f"{path} is not a version {self.VERSION} ranked snapshot")
+        magic, version, _, self.count = self.HEADER.unpack_from(self._mmap, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {self.VERSION} ranked snapshot")
+        arrays_size = sum(8 * (self.count + extra) for _, _, extra in self.SECTIONS)
+        if len(self._mmap) < self.HEADER.size + arrays_size:
+            self.close()
+            raise ValueError(f"{path} is truncated: expected arrays for {self.count} sitters")
+
+        # Each section is a zero-copy typed view over the mapped file
+        offset = self.HEADER.size
+        for name, typecode, extra in self.SECTIONS:
+            size = 8 * (self.count + extra)
+            setattr(self, f'_{name}', self._view[offset:offset + size].cast(typecode))
+            offset += size
+        self._blob = self._view[offset:]
+        # Emails are written after names, so the last email offset is the blob's length
+        blob_size = self._email_offsets[self.count]
+        if blob_size > len(self._blob):
+            self.close()
+            raise ValueError(f"{path} is truncated: expected a {blob_size} byte string blob")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+    def close(self):
+        """
+        Releases all views over the mapped file and unmaps it.
+        """
+        for name, _, _ in self.SECTIONS:
+            view = self.__dict__.pop(f'_{name}', None)
+            if view is not None:
+                view.release()
+        blob = self.__dict__.pop('_blob', None)
+        if blob is not None:
+            blob.release()
+        self._view.release()
+        self._mmap.close()
+
+    def _string(self, offsets, position):
+        """
+        Decodes the string at a rank position from the string blob.
+        """
+        return str(self._blob[offsets[position]:offsets[position + 1]], 'utf-8')
+
+    def record(self, position):
+        """
+        Builds the record for the sitter at a zero-based rank position.
+
+        Args:
+            position (int): The zero-based rank position.
+
+        Returns:
+            dict: The sitter's rank, id, email, name and scores.
+        """
+        return {
+            'rank': position + 1,
+            'id': self._ids[position],
+            'email': self._string(self._email_offsets, position),
+            'name': self._string(self._name_offsets, position),
+            'profile_score': self._profile_scores[position],
+            'ratings_score': self._ratings_scores[position],
+            'search_score': self._search_scores[position],
+        }
+
+    def top_k(self, k):
+        """
+        Returns the records of the `k` highest ranked sitters.
+
+        Args:
+            k (int): The number of sitters to return.
+
+        Returns:
+            list: A list of record dictionaries, best ranked first.
+        """
+        return [self.record(position) for position in range(min(k, self.count))]
+
+    def rank_of(self, sitter_id):
+        """
+        Looks up the one-based rank of a sitter by id.
+
+        Args:
+            sitter_id (int): The sitter's id.
+
+        Returns:
+            int: The sitter's rank, or None if the sitter is not in the snapshot.
+        """
+        index = self._id_index
+        i = bisect_left(index, sitter_id, key=lambda position: self._ids[position])
+        if i < self.count and self._ids[index[i]] == sitter_id:
+            return index[i] + 1
+        return None
+
+    def find_by_email(self, email):
+        """
+        Looks up a sitter's record by email.
+
+        Args:
+            email (str): The sitter's email.
+
+        Returns:
+            dict: The sitter's record, or None if no sitter has that email.
+        """
+        target = email.encode('utf-8')
+        offsets = self._email_offsets
+        index = self._email_index
+        key = lambda position: self._blob[offsets[position]:offsets[position + 1]].tobytes()
+        i = bisect_left(index, target, key=key)
+        if i < self.count and key(index[i]) == target:
+            return self.record(index[i])
+        return None
+
+    def iter_by_email(self):
+        """
+        Yields every sitter's record in email order, using the snapshot's email index.
+
+        Emails are ordered by their UTF-8 bytes, matching the order of `email_index`.
+
+        Yields:
+            dict: Sitter records, in ascending email order.
+        """
+        for position in self._email_index:
+            yield self.record(position)
+
+    @classmethod
+    def write(cls, path, ranked_records):
+        """
+        Writes ranked sitter data to a snapshot file and atomically publishes it.
+
+        The snapshot is published with `write_atomically`, so readers see either the
+        previous snapshot or the new one, never a partially written file. Readers that
+        already mapped the previous snapshot keep a consistent view of it until they
+        close it.
+
+        Args:
+            path (str): The path to publish the snapshot at.
+            ranked_records (list): Sitter dictionaries sorted best ranked first, with `id`, `email`,
+                `name`, `profile_score`, `ratings_score` and `search_score` keys.
+        """
+        if sys.byteorder != 'little':
+            raise ValueError("Ranked snapshots can only be written on little-endian hosts")
+
+        count = len(ranked_records)
+        names = [(record['name'] or '').encode('utf-8') for record in ranked_records]
+        emails = [(record['email'] or '').encode('utf-8') for record in ranked_records]
+
+        blob = bytearray()
+        name_offsets = array('Q')
+        for name in names:
+            name_offsets.append(len(blob))
+            blob += name
+        name_offsets.append(len(blob))
+        email_offsets = array('Q')
+        for email in emails:
+            email_offsets.append(len(blob))
+            blob += email
+        email_offsets.append(len(blob))
+
+        ids = [record['id'] for record in ranked_records]
+        sections = {
+            'ids': array('q', ids),
+            'profile_scores': array('d', [record['profile_score'] for record in ranked_records]),
+            'ratings_scores': array('d', [record['ratings_score'] for record in ranked_records]),
+            'search_scores': array('d', [record['search_score'] for record in ranked_records]),
+            'name_offsets': name_offsets,
+            'email_offsets': email_offsets,
+            'email_index': array('Q', sorted(range(count), key=emails.__getitem__)),
+            'id_index': array('Q', sorted(range(count), key=ids.__getitem__)),
+        }
+
+        chunks = [cls.HEADER.pack(cls.MAGIC, cls.VERSION, 0, count)]
+        chunks.extend(sections[name].tobytes() for name, _, _ in cls.SECTIONS)
+        chunks.append(blob)
+        write_atomically(path, chunks)
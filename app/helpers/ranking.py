@@ -0,0 +1,76 @@
+import csv
+import io
+from app.helpers.atomic_file import write_atomically
+from app.helpers.rank_delta import DELTA_COLUMNS, SCORE_COLUMNS, compute_rank_delta_since
+from app.helpers.ranked_snapshot import RankedSnapshot
+
+OUTPUT_COLUMNS = ['email', 'name', 'profile_score', 'ratings_score', 'search_score']
+
+def rank(sitter_records):
+    """
+    Sorts sitter records into search ranking order.
+
+    Args:
+        sitter_records (list): Sitter dictionaries with scores, such as those returned by
+            `Sitter.calculate_all_search_scores`.
+
+    Returns:
+        list: The records sorted by `search_score` in descending order, with ties broken
+        alphabetically by `name`.
+    """
+    return sorted(sitter_records, key=lambda record: (-record['search_score'], record['name']))
+
+def _format_row(record, columns):
+    """
+    Formats a record as a CSV row, writing scores with two decimals and None as empty.
+    """
+    row = []
+    for column in columns:
+        value = record[column]
+        if value is None:
+            row.append('')
+        elif column in SCORE_COLUMNS:
+            row.append('%.2f' % value)
+        else:
+            row.append(value)
+    return row
+
+def _write_rows(records, columns, csv_path):
+    """
+    Writes records to a CSV file with a header row of `columns`.
+
+    The file is published with `write_atomically`, so readers such as downstream sync
+    never see a partially written file, even if the run fails part way through.
+    """
+    output = io.StringIO()
+    writer = csv.writer(output, lineterminator='\n')
+    writer.writerow(columns)
+    for record in records:
+        writer.writerow(_format_row(record, columns))
+    write_atomically(csv_path, [output.getvalue().encode('utf-8')])
+
+def write_csv(ranked_records, csv_path):
+    """
+    Writes ranked sitter records to a CSV file with the email, name and score columns.
+
+    Args:
+        ranked_records (list): Sitter dictionaries sorted best ranked first.
+        csv_path (str): The path of the CSV file to write.
+    """
+    _write_rows(ranked_records, OUTPUT_COLUMNS, csv_path)
+
+def publish(ranked_records, snapshot_path, delta_path):
+    """
+    Publishes a new ranking as a delta file and a ranked snapshot.
+
+    Args:
+        ranked_records (list): Sitter dictionaries sorted best ranked first, as returned by `rank`.
+        snapshot_path (str): The path of the ranked snapshot to replace.
+        delta_path (str): The path of the CSV file to write the changes to.
+
+    The changes since the previous snapshot are atomically published to `delta_path` first,
+    since `RankedSnapshot.write` then atomically replaces the previous snapshot.
+    """
+    delta = compute_rank_delta_since(snapshot_path, ranked_records)
+    _write_rows(delta, DELTA_COLUMNS, delta_path)
+    RankedSnapshot.write(snapshot_path, ranked_records)
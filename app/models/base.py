@@ -1,14 +1,11 @@
-from sqlalchemy import insert, update
+from sqlalchemy import Column, DateTime, Integer, func, insert, update
 from sqlalchemy.orm import DeclarativeBase
-from app.extensions import db
 
 # Declarative base class
 class Base(DeclarativeBase):
-    metadata = db.metadata  # Associate with the SQLAlchemy metadata
-
     # Common cols passed down to all models
-    id = db.Column(db.Integer, primary_key=True)
-    created_on = db.Column(db.DateTime, default=db.func.now())
+    id = Column(Integer, primary_key=True)
+    created_on = Column(DateTime, default=func.now())
 
     @classmethod
     def bulk_add(cls, session, data, sorted=False):
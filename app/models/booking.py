@@ -1,12 +1,12 @@
-from app.extensions import db
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Integer
 from app.models.base import Base
 
 class Booking(Base):
     __tablename__ = 'bookings'
-    id = db.Column(db.Integer, primary_key=True)
-    sitter_id = db.Column(db.Integer, db.ForeignKey('sitters.id'))
-    owner_id = db.Column(db.Integer, db.ForeignKey('users.id'))
+    id = Column(Integer, primary_key=True)
+    sitter_id = Column(Integer, ForeignKey('sitters.id'))
+    owner_id = Column(Integer, ForeignKey('users.id'))
     # Date/time that sitter confirmed the request
-    confirmed_date = db.Column(db.DateTime)
-    start_date = db.Column(db.Date, nullable=False)
-    end_date = db.Column(db.Date)
+    confirmed_date = Column(DateTime)
+    start_date = Column(Date, nullable=False)
+    end_date = Column(Date)
@@ -1,4 +1,4 @@
-from app.extensions import db
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, func
 from app.models.pet import Pet
 
 class Dog(Pet):
@@ -7,7 +7,7 @@ class Dog(Pet):
         "concrete": True,
     }
     
-    id = db.Column(db.Integer, db.ForeignKey('pets.id'), primary_key=True, nullable=False)
-    name = db.Column(db.String(100), nullable=False)
-    owner_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
-    created_on = db.Column(db.DateTime, default=db.func.now())
+    id = Column(Integer, ForeignKey('pets.id'), primary_key=True, nullable=False)
+    name = Column(String(100), nullable=False)
+    owner_id = Column(Integer, ForeignKey('users.id'), nullable=False)
+    created_on = Column(DateTime, default=func.now())
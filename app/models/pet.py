@@ -1,4 +1,4 @@
-from app.extensions import db
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, func
 from app.models.base import Base
 class Pet(Base):
     __tablename__ = 'pets'
@@ -9,8 +9,8 @@ class Pet(Base):
     #     'polymorphic_identity': 'pet',
     #     'polymorphic_on': 'type'
     # }
-    # type = db.Column(db.String(50))
-    name = db.Column(db.String(100), nullable=False)
-    owner_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
-    created_on = db.Column(db.DateTime, default=db.func.now())
+    # type = Column(String(50))
+    name = Column(String(100), nullable=False)
+    owner_id = Column(Integer, ForeignKey('users.id'), nullable=False)
+    created_on = Column(DateTime, default=func.now())
     
\ No newline at end of file
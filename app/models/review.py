@@ -1,19 +1,18 @@
-from sqlalchemy import UniqueConstraint
-from app.extensions import db
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, Text, UniqueConstraint
 from app.models.base import Base
 from sqlalchemy.sql import func
 
 class Review(Base):
     __tablename__ = 'reviews'
-    id = db.Column(db.Integer, primary_key=True)
-    rating = db.Column(db.Integer, nullable=False)
-    description = db.Column(db.Text)
+    id = Column(Integer, primary_key=True)
+    rating = Column(Integer, nullable=False)
+    description = Column(Text)
     # To support case where sitter can also review an owner, reviewer and reviewee cols both point to users table.
-    reviewer = db.Column(db.Integer, db.ForeignKey('users.id'))
-    reviewee = db.Column(db.Integer, db.ForeignKey('sitters.id'))
+    reviewer = Column(Integer, ForeignKey('users.id'))
+    reviewee = Column(Integer, ForeignKey('sitters.id'))
     # Attaches a review to a specific stay -- would need reconsideration if reviews could be created outside of this context
-    booking_id = db.Column(db.Integer, db.ForeignKey('bookings.id'))
-    created_on = db.Column(db.DateTime, default=db.func.now())
+    booking_id = Column(Integer, ForeignKey('bookings.id'))
+    created_on = Column(DateTime, default=func.now())
     
     __table_args__ = (
         UniqueConstraint('booking_id', 'reviewer', 'reviewee', name='unique_review_constraint'),
@@ -1,5 +1,5 @@
 import statistics
-from app.extensions import db
+from sqlalchemy import Column, ForeignKey, Integer, String
 from app.models.review import Review
 from app.models.user import User
 
@@ -16,13 +16,13 @@ class Sitter(User):
         "concrete": True,
     }
 
-    id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
-    name = db.Column(db.String(100), nullable=False)
-    email = db.Column(db.String(100), unique=True)
-    phone_number = db.Column(db.String(100))
-    image = db.Column(db.String(100))
-    number_of_reviews = db.Column(db.Integer)
-    sum_of_reviews = db.Column(db.Integer)
+    id = Column(Integer, ForeignKey('users.id'), primary_key=True)
+    name = Column(String(100), nullable=False)
+    email = Column(String(100), unique=True)
+    phone_number = Column(String(100))
+    image = Column(String(100))
+    number_of_reviews = Column(Integer)
+    sum_of_reviews = Column(Integer)
 
     def get_unique_letters(self):
         """
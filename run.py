@@ -1,86 +1,46 @@
 from app import create_app
-import pandas as pd
 import sys
 from app.models.sitter import Sitter
-from app.models.review import Review
-from app.helpers.csv_handler import CsvHandler
+from app.helpers import ingestion, ranking
 
 from app.extensions import db
 
-def create_db():
+def rank_search_scores():
     """
-    Drops the current db and recreates it.
-    """
-    db.drop_all()
-    db.create_all()
-
+    Calculates sitter search scores and returns them in ranked order.
 
-def bulk_update(entity_df, entity_class):
-    """
-    Bulk updates entities in the database from a DataFrame.
-
-    Args:
-        entity_df (DataFrame): The DataFrame containing entity data to be updated.
-        entity_class (class): The ORM class representing the database table.
+    This function retrieves search score data for all sitters by calling the
+    `calculate_all_search_scores` method of the `Sitter` class and sorts it with `ranking.rank`,
+    by search score in descending order with ties broken alphabetically by name.
 
-    This function drops duplicate rows from the given DataFrame, converts it to a list of dictionaries,
-    and then performs a bulk update in the database using the `bulk_update` method of the `entity_class`.
+    Returns:
+        list: A list of sitter dictionaries with ids, emails, names and scores, best ranked first.
     """
-    unique_entity_df = entity_df.drop_duplicates()
-    unique_entity_list = unique_entity_df.to_dict(orient='records')
-    entity_class.bulk_update(db.session, unique_entity_list)
+    return ranking.rank(Sitter.calculate_all_search_scores(db.session))
 
-def parse_csv(csv_path):
+def output_csv(ranked_records):
     """
-    Parses a CSV file and commits its data to the database.
+    Outputs ranked sitter search scores to a CSV file.
 
     Args:
-        csv_path (str): The path to the CSV file.
-
-    This function creates an instance of `CsvHandler` and calls its
-    `parse_and_commit_data` method to handle the parsing and committing process.
-    """
-    csv_handler = CsvHandler(csv_path, db.session)
-    csv_handler.parse_and_commit_data()
+        ranked_records (list): The ranked sitter data returned by `rank_search_scores`.
 
-def update_sitter_info():
+    This function outputs the ranked sitters to a CSV file named 'sitters.csv' using `ranking.write_csv`.
     """
-    Updates sitter information in the database with review statistics.
+    ranking.write_csv(ranked_records, 'sitters.csv')
 
-    This function queries review statistics per sitter, renames columns for consistency,
-    and uses `bulk_update` to update each sitter with their respective sum and count of reviews.
-    The session is then committed to save the updates.
+def output_ranking(ranked_records):
     """
-    sitter_review_df = pd.read_sql(Review.get_reviews_per_reviewee(db.session).statement, con=db.session.get_bind())
-    sitter_review_df = sitter_review_df.rename(columns={'reviewee': 'id'})
-    bulk_update(sitter_review_df, Sitter)
-    db.session.commit()
+    Outputs the changes since the previous run and a memory-mappable ranked snapshot.
 
-def calculate_search_scores():
-    """
-    Calculates and returns sitter search scores as a DataFrame.
-
-    This function retrieves search score data for all sitters by calling the
-    `calculate_all_search_scores` method of the `Sitter` class using the database session.
-    It then converts the retrieved data into a pandas DataFrame and returns it.
-
-    Returns:
-        DataFrame: A DataFrame containing the search scores and other relevant data for sitters.
-    """
-    sitter_data = Sitter.calculate_all_search_scores(db.session)
-    return pd.DataFrame(sitter_data)
-
-def output_csv():
-    """
-    Outputs sitter search scores to a CSV file.
+    Args:
+        ranked_records (list): The ranked sitter data returned by `rank_search_scores`.
 
-    This function calls calculate_search_scores to get a DataFrame of sitter data,
-    formats and sorts the DataFrame, and outputs it to a CSV file named 'sitters.csv'.
+    This function calls `ranking.publish`, which writes the inserted, removed and re-scored sitters
+    since the previous 'sitters.snapshot' to 'sitters_delta.csv' and then atomically replaces
+    'sitters.snapshot' so readers can keep serving from it.
     """
-    output_df = calculate_search_scores()
-    output_df = output_df[["email", "name", "profile_score", "ratings_score", "search_score"]]
-    output_df.sort_values(by=['search_score', 'name'], ascending=[False, True], inplace=True)
-    output_df.to_csv('sitters.csv', index=False, float_format='%.2f')
+    ranking.publish(ranked_records, 'sitters.snapshot', 'sitters_delta.csv')
 
 if __name__ == '__main__':
     """
@@ -88,11 +48,12 @@ if __name__ == '__main__':
 
     This section initializes the application context, creates the database,
     parses a CSV file to populate the database, updates sitter information
-    with review statistics, and outputs sitter search scores to a CSV file.
+    with review statistics, and outputs sitter search scores to a CSV file,
+    a CSV file of changes since the previous run and a memory-mapped ranked snapshot.
     """
     app = create_app()
     with app.app_context():
-        create_db()
-        parse_csv(sys.argv[1])
-        update_sitter_info()
-        output_csv()
+        ingestion.ingest(db.session, sys.argv[1])
+        ranked_records = rank_search_scores()
+        output_csv(ranked_records)
+        output_ranking(ranked_records)
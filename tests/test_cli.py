@@ -0,0 +1,55 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+from app.cli import main
+from config import Config
+from app.helpers.ranked_snapshot import RankedSnapshot
+
+ROOT = Path(__file__).resolve().parent.parent
+
+def test_export_writes_snapshot_as_csv(tmp_path):
+    snapshot_path = str(tmp_path / "sitters.snapshot")
+    output_path = tmp_path / "sitters.csv"
+    RankedSnapshot.write(snapshot_path, [
+        {"id": 2, "email": "bob@example.com", "name": "Bob, Jr.", "profile_score": 0.58, "ratings_score": 4, "search_score": 4.0},
+        {"id": 1, "email": "amy@example.com", "name": "Amy", "profile_score": 0.38, "ratings_score": 0, "search_score": 0.38},
+    ])
+
+    main(["export", "--snapshot", snapshot_path, "--output", str(output_path)])
+
+    assert output_path.read_text() == (
+        "email,name,profile_score,ratings_score,search_score\n"
+        "bob@example.com,\"Bob, Jr.\",0.58,4.00,4.00\n"
+        "amy@example.com,Amy,0.38,0.00,0.38\n"
+    )
+
+def test_cli_does_not_import_heavy_modules():
+    # Run in a fresh interpreter, since this test session has already imported them
+    code = "import sys, app.cli; print(sorted({'flask', 'flask_sqlalchemy', 'pandas', 'sqlalchemy'} & set(sys.modules)))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                            cwd=ROOT)
+    assert result.stdout.strip() == "[]"
+
+def test_ingest_and_score_match_run_py(tmp_path, monkeypatch):
+    csv_path = str(ROOT / "data" / "reviews.csv")
+
+    # Reference output from the Flask entry point, run against its own database
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+    env = dict(os.environ, DATABASE_URI=f"sqlite:///{run_dir / 'app.db'}")
+    subprocess.run([sys.executable, str(ROOT / "run.py"), csv_path], cwd=run_dir, env=env, check=True)
+
+    cli_dir = tmp_path / "cli"
+    cli_dir.mkdir()
+    monkeypatch.setattr(Config, "SQLALCHEMY_DATABASE_URI", f"sqlite:///{cli_dir / 'app.db'}")
+    snapshot_path = str(cli_dir / "sitters.snapshot")
+    main(["ingest", csv_path])
+    main(["score", "--snapshot", snapshot_path, "--delta", str(cli_dir / "sitters_delta.csv")])
+    main(["export", "--snapshot", snapshot_path, "--output", str(cli_dir / "sitters.csv")])
+
+    assert (cli_dir / "sitters.csv").read_text() == (run_dir / "sitters.csv").read_text()
+    assert (cli_dir / "sitters_delta.csv").read_text() == (run_dir / "sitters_delta.csv").read_text()
+    with RankedSnapshot(snapshot_path) as cli_snapshot, RankedSnapshot(str(run_dir / "sitters.snapshot")) as run_snapshot:
+        assert len(cli_snapshot) > 0
+        assert cli_snapshot.top_k(len(cli_snapshot)) == run_snapshot.top_k(len(run_snapshot))
@@ -0,0 +1,67 @@
+import pytest
+from app.helpers.rank_delta import compute_rank_delta, compute_rank_delta_since
+from app.helpers.ranked_snapshot import RankedSnapshot
+
+def make_ranked_records(rows):
+    columns = ["id", "email", "name", "profile_score", "ratings_score", "search_score"]
+    return [dict(zip(columns, row)) for row in rows]
+
+@pytest.fixture
+def previous_records():
+    return make_ranked_records([
+        (1, "amy@example.com", "Amy", 0.58, 5.0, 5.0),
+        (2, "bob@example.com", "Bob", 0.38, 4.0, 4.0),
+        (3, "cat@example.com", "Cat", 0.58, 0, 0.58),
+    ])
+
+def test_unchanged_ranking_has_no_delta(tmp_path, previous_records):
+    path = str(tmp_path / "sitters.snapshot")
+    RankedSnapshot.write(path, previous_records)
+    with RankedSnapshot(path) as snapshot:
+        delta = compute_rank_delta(snapshot.iter_by_email(), previous_records)
+    assert delta == []
+
+def test_inserted_removed_and_rescored(tmp_path, previous_records):
+    path = str(tmp_path / "sitters.snapshot")
+    RankedSnapshot.write(path, previous_records)
+    new_records = make_ranked_records([
+        (4, "dan@example.com", "Dan", 0.58, 4.5, 4.5),   # New sitter
+        (1, "amy@example.com", "Amy", 0.58, 4.0, 4.0),   # Rating dropped
+        (3, "cat@example.com", "Cat", 0.58, 0, 0.58),    # Unchanged, but rank shifted
+    ])
+    with RankedSnapshot(path) as snapshot:
+        delta = compute_rank_delta(snapshot.iter_by_email(), new_records)
+
+    assert [row["change"] for row in delta] == ["rescored", "removed", "inserted"]
+    assert [row["email"] for row in delta] == ["amy@example.com", "bob@example.com", "dan@example.com"]
+    assert [row["rank"] for row in delta] == [2, None, 1]
+    assert delta[0]["search_score"] == 4.0
+
+def test_without_previous_run_every_sitter_is_inserted(previous_records):
+    delta = compute_rank_delta([], previous_records)
+    assert [row["change"] for row in delta] == ["inserted"] * 3
+    assert [row["rank"] for row in delta] == [1, 2, 3]
+
+@pytest.mark.parametrize(
+    "contents",
+    [
+        None,                                                       # No previous run
+        b"",                                                        # Empty file
+        RankedSnapshot.HEADER.pack(RankedSnapshot.MAGIC, 9, 0, 0),  # Unsupported version
+        b"not a snapshot at all, just some text",                   # Bad magic
+    ]
+)
+def test_missing_or_unreadable_snapshot_exports_full_delta(tmp_path, previous_records, contents):
+    path = tmp_path / "sitters.snapshot"
+    if contents is not None:
+        path.write_bytes(contents)
+    delta = compute_rank_delta_since(str(path), previous_records)
+    assert [row["change"] for row in delta] == ["inserted"] * 3
+
+def test_truncated_snapshot_exports_full_delta(tmp_path, previous_records):
+    path = tmp_path / "sitters.snapshot"
+    RankedSnapshot.write(str(path), previous_records)
+    with open(path, "r+b") as f:
+        f.truncate(100)
+    delta = compute_rank_delta_since(str(path), previous_records)
+    assert [row["change"] for row in delta] == ["inserted"] * 3
@@ -0,0 +1,88 @@
+import os
+import stat
+import pytest
+from app.helpers.ranked_snapshot import RankedSnapshot
+
+@pytest.fixture
+def ranked_records():
+    return [
+        {"id": 7, "email": "zoe@example.com", "name": "Zoë", "profile_score": 0.58, "ratings_score": 5.0, "search_score": 5.0},
+        {"id": 3, "email": "bob@example.com", "name": "Bob", "profile_score": 0.38, "ratings_score": 4.0, "search_score": 4.0},
+        {"id": 12, "email": "amy@example.com", "name": "Amy", "profile_score": 0.58, "ratings_score": 0, "search_score": 0.58},
+    ]
+
+@pytest.fixture
+def snapshot_path(tmp_path, ranked_records):
+    path = tmp_path / "sitters.snapshot"
+    RankedSnapshot.write(str(path), ranked_records)
+    return str(path)
+
+def test_top_k(snapshot_path):
+    with RankedSnapshot(snapshot_path) as snapshot:
+        assert len(snapshot) == 3
+        assert [record["name"] for record in snapshot.top_k(2)] == ["Zoë", "Bob"]
+        assert [record["rank"] for record in snapshot.top_k(10)] == [1, 2, 3]
+
+@pytest.mark.parametrize(
+    "sitter_id, expected_rank",
+    [
+        (7, 1),       # Best ranked sitter
+        (3, 2),       # Middle of the ranking
+        (12, 3),      # Lowest ranked sitter
+        (5, None),    # Not in the snapshot
+    ]
+)
+def test_rank_of(snapshot_path, sitter_id, expected_rank):
+    with RankedSnapshot(snapshot_path) as snapshot:
+        assert snapshot.rank_of(sitter_id) == expected_rank
+
+def test_find_by_email(snapshot_path):
+    with RankedSnapshot(snapshot_path) as snapshot:
+        record = snapshot.find_by_email("bob@example.com")
+        assert record == {
+            "rank": 2, "id": 3, "email": "bob@example.com", "name": "Bob",
+            "profile_score": 0.38, "ratings_score": 4.0, "search_score": 4.0,
+        }
+        assert snapshot.find_by_email("nobody@example.com") is None
+
+def test_write_replaces_snapshot_without_disturbing_open_readers(snapshot_path, ranked_records):
+    with RankedSnapshot(snapshot_path) as old_snapshot:
+        RankedSnapshot.write(snapshot_path, ranked_records[::-1])
+        # Readers of the previous snapshot keep their view until they close it
+        assert old_snapshot.rank_of(7) == 1
+        with RankedSnapshot(snapshot_path) as new_snapshot:
+            assert new_snapshot.rank_of(7) == 3
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "sitters.csv"
+    path.write_bytes(b"email,name,profile_score,ratings_score,search_score\n")
+    with pytest.raises(ValueError):
+        RankedSnapshot(str(path))
+
+@pytest.mark.parametrize(
+    "size",
+    [
+        0,      # Empty file
+        10,     # Shorter than the header
+        100,    # Header intact, arrays cut off
+        -3,     # Arrays intact, string blob cut off
+    ]
+)
+def test_rejects_truncated_snapshots(snapshot_path, size):
+    with open(snapshot_path, "r+b") as f:
+        f.truncate(size if size >= 0 else os.path.getsize(snapshot_path) + size)
+    with pytest.raises(ValueError):
+        RankedSnapshot(snapshot_path)
+
+def test_write_publishes_with_umask_mode(tmp_path, monkeypatch, ranked_records):
+    path = tmp_path / "sitters.snapshot"
+    umask = os.umask(0o022)
+    try:
+        # The umask is process-wide, so writing must not change it even briefly
+        with monkeypatch.context() as m:
+            m.setattr(os, "umask", lambda mask: pytest.fail("os.umask was called"))
+            RankedSnapshot.write(str(path), ranked_records)
+    finally:
+        os.umask(umask)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o644
+    assert os.listdir(tmp_path) == ["sitters.snapshot"]
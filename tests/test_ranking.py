@@ -0,0 +1,47 @@
+import os
+import pytest
+from app.helpers import ranking
+
+def make_record(id, email, name, search_score):
+    return {"id": id, "email": email, "name": name, "profile_score": 0.38, "ratings_score": 0, "search_score": search_score}
+
+def test_rank_sorts_by_search_score_then_name():
+    records = [
+        make_record(1, "cat@example.com", "Cat", 2.5),
+        make_record(2, "bob@example.com", "Bob", 4.0),
+        make_record(3, "amy@example.com", "Amy", 2.5),   # Ties with Cat, wins alphabetically
+    ]
+    assert [record["name"] for record in ranking.rank(records)] == ["Bob", "Amy", "Cat"]
+
+def test_publish_writes_delta_and_snapshot(tmp_path):
+    snapshot_path = str(tmp_path / "sitters.snapshot")
+    delta_path = tmp_path / "sitters_delta.csv"
+    ranking.publish(ranking.rank([
+        make_record(1, "amy@example.com", "Amy", 2.5),
+        make_record(2, "bob@example.com", "Bob", 4.0),
+    ]), snapshot_path, str(delta_path))
+    ranking.publish(ranking.rank([
+        make_record(1, "amy@example.com", "Amy", 4.5),
+    ]), snapshot_path, str(delta_path))
+
+    assert delta_path.read_text() == (
+        "change,email,name,rank,profile_score,ratings_score,search_score\n"
+        "rescored,amy@example.com,Amy,1,0.38,0.00,4.50\n"
+        "removed,bob@example.com,,,,,\n"
+    )
+
+def test_failed_publish_leaves_previous_delta_untouched(tmp_path):
+    snapshot_path = str(tmp_path / "sitters.snapshot")
+    delta_path = tmp_path / "sitters_delta.csv"
+    ranking.publish([make_record(1, "amy@example.com", "Amy", 2.5)], snapshot_path, str(delta_path))
+    previous_delta = delta_path.read_text()
+
+    # A score that cannot be formatted makes the delta fail part way through
+    with pytest.raises(TypeError):
+        ranking.publish([
+            make_record(1, "amy@example.com", "Amy", 2.5),
+            make_record(2, "bob@example.com", "Bob", "not a score"),
+        ], snapshot_path, str(delta_path))
+
+    assert delta_path.read_text() == previous_delta
+    assert sorted(os.listdir(tmp_path)) == ["sitters.snapshot", "sitters_delta.csv"]